@@ -3,46 +3,147 @@
 MCP server that auto-discovers and exposes all public functions in utils/*.py.
 """
 
-import importlib
+import ast
+import functools
 import inspect
 import pathlib
+from collections.abc import Callable
+from typing import Any
 
 from fastmcp import FastMCP
 
+from utils._tool_index import _cached_import, _load_tool_index
+
 mcp = FastMCP("Tools")
 
+# The only names an annotation string from the tool index may refer to.
+_ANNOTATION_NAMESPACE: dict[str, Any] = {
+    "Any": Any,
+    "bool": bool,
+    "bytes": bytes,
+    "dict": dict,
+    "float": float,
+    "int": int,
+    "list": list,
+    "str": str,
+    "tuple": tuple,
+}
+
+# Resolved callables, keyed by `{namespace}__{function}`.
+_RESOLVED: dict[str, Callable[..., Any]] = {}
+
+
+def _load_tool(namespace: str, name: str) -> Callable[..., Any]:
+    """Import `utils.{namespace}` on first use and return the function."""
+    qualified_name = f"{namespace}__{name}"
+    func = _RESOLVED.get(qualified_name)
+    if func is None:
+        module = _cached_import(f"utils.{namespace}")
+        func = _RESOLVED[qualified_name] = getattr(module, name)
+    return func
+
+
+def _resolve_annotation(node: ast.expr) -> Any:
+    """Resolve a parsed annotation using only `_ANNOTATION_NAMESPACE`.
+
+    The tool index is a file on disk, so its annotation strings are
+    never passed to eval(); names, `X[...]`, `X | Y`, tuples, and None
+    cover every annotation the utils modules use.
+
+    Raises:
+        ValueError: If the annotation uses anything else.
+    """
+    if isinstance(node, ast.Name) and node.id in _ANNOTATION_NAMESPACE:
+        return _ANNOTATION_NAMESPACE[node.id]
+    if isinstance(node, ast.Constant) and node.value is None:
+        return None
+    if isinstance(node, ast.Subscript):
+        return _resolve_annotation(node.value)[_resolve_annotation(node.slice)]
+    if isinstance(node, ast.Tuple):
+        return tuple(_resolve_annotation(elt) for elt in node.elts)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _resolve_annotation(node.left) | _resolve_annotation(node.right)
+    raise ValueError(f"Unsupported annotation: {ast.unparse(node)}")
+
+
+def _stub_signature(entry: dict[str, Any]) -> inspect.Signature | None:
+    """Rebuild a tool signature from its index entry.
+
+    Returns None if any annotation cannot be resolved without
+    importing the module.
+    """
+    if entry["params"] is None:
+        return None
+
+    def _evaluate(annotation: str | None) -> Any:
+        if annotation is None:
+            return inspect.Parameter.empty
+        return _resolve_annotation(ast.parse(annotation, mode="eval").body)
+
+    try:
+        parameters = [
+            inspect.Parameter(
+                param["name"],
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=param.get("default", inspect.Parameter.empty),
+                annotation=_evaluate(param.get("annotation")),
+            )
+            for param in entry["params"]
+        ]
+        returns = _evaluate(entry["returns"])
+    except Exception:
+        return None
+    return inspect.Signature(parameters, return_annotation=returns)
+
+
+def _make_stub(entry: dict[str, Any]) -> Callable[..., Any]:
+    """Return a tool callable that defers the module import to first call."""
+    namespace, name = entry["namespace"], entry["function"]
+    sig = _stub_signature(entry)
+    if sig is None:
+        return _load_tool(namespace, name)
+
+    func: Callable[..., Any] | None = None
+
+    def stub(**kwargs: Any) -> Any:
+        nonlocal func
+        if func is None:
+            func = _load_tool(namespace, name)
+        return func(**kwargs)
+
+    stub.__name__ = name
+    stub.__qualname__ = name
+    stub.__doc__ = entry["doc"]
+    stub.__signature__ = sig  # ty: ignore[unresolved-attribute]
+    stub.__annotations__ = {
+        p.name: p.annotation for p in sig.parameters.values() if p.annotation is not p.empty
+    }
+    if sig.return_annotation is not sig.empty:
+        stub.__annotations__["return"] = sig.return_annotation
+    return stub
 
+
+@functools.cache
 def _discover_and_register() -> None:
     """
-    Dynamically import all public functions from utils/*.py and
-    register as MCP tools.
+    Register every public function in utils/*.py as an MCP tool.
+
+    Runs once per process; repeated calls are no-ops.
+
+    Metadata comes from tools_index.json (or a static scan of the
+    sources when it is missing or stale), so no utils module is
+    imported until one of its tools is first called.
     """
-    utils_dir = pathlib.Path(__file__).parent / "utils"
-
-    for module_path in sorted(utils_dir.glob("*.py")):
-        if module_path.name.startswith("_"):
-            continue
-
-        namespace = module_path.stem
-        module_name = f"utils.{namespace}"
-        module = importlib.import_module(module_name)
-
-        ns_doc = (module.__doc__ or "").strip().split("\n")[0]
-
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            if not name.startswith("_") and obj.__module__ == module.__name__:
-                qualified_name = f"{namespace}__{name}"
-                func_doc = (obj.__doc__ or "").strip()
-                if ns_doc and func_doc:
-                    description = f"[{namespace}] {ns_doc}\n\n{func_doc}"
-                elif func_doc:
-                    description = func_doc
-                else:
-                    description = f"[{namespace}] utility function"
-                mcp.tool(
-                    name=qualified_name,
-                    description=description,
-                )(obj)
+    server_dir = pathlib.Path(__file__).parent
+
+    for qualified_name, entry in _load_tool_index(
+        server_dir / "tools_index.json",
+        server_dir / "utils",
+    ).items():
+        mcp.tool(
+            name=qualified_name,
+            description=entry["description"],
+        )(_make_stub(entry))
 
 
 _discover_and_register()
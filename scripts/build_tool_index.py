@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Write tools_index.json so the MCP server can start without scanning utils/."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils._tool_index import _write_tool_index  # noqa: E402
+
+
+def main() -> int:
+    """CLI entrypoint."""
+    index_path = PROJECT_ROOT / "tools_index.json"
+    index = _write_tool_index(index_path, PROJECT_ROOT / "utils")
+    print(f"Wrote {len(index)} tools to {index_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import subprocess
 import sys
+import urllib.request
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -28,3 +32,30 @@ def ipinfo_source_url(fixture_dir: Path) -> str:
 def weather_source_url(fixture_dir: Path) -> str:
     """Return file:// URL for mocked weather HTML."""
     return (fixture_dir / "weather.mock.html").as_uri()
+
+
+@pytest.fixture
+def no_network(monkeypatch: pytest.MonkeyPatch) -> Callable[[], None]:
+    """Return a function that makes any later `urlopen` call fail the test.
+
+    Tests call it after priming a cache, so the first fetch (of a
+    file:// fixture) still goes through urllib.
+    """
+
+    def fail_urlopen(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("unexpected urllib.request.urlopen call")
+
+    def block() -> None:
+        monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
+
+    return block
+
+
+@pytest.fixture
+def no_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make any `subprocess.run` call fail the test."""
+
+    def fail_run(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("unexpected subprocess.run call")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
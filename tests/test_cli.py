@@ -0,0 +1,118 @@
+"""Tests for the utils.py command-line entry point."""
+
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import io
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from utils import datetime as datetime_utils
+from utils import geo_location
+from utils import math as math_utils
+
+_CLI_PATH = Path(__file__).resolve().parent.parent / "utils.py"
+
+
+@pytest.fixture(scope="module")
+def cli() -> ModuleType:
+    """Load utils.py, which the utils/ package shadows as a plain import."""
+    spec = importlib.util.spec_from_file_location("utils_cli", _CLI_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    "func",
+    [math_utils.add, math_utils.log, datetime_utils.current, geo_location.coordinates_by_name],
+)
+def test_format_signature_matches_inspect(cli: ModuleType, func: Any) -> None:
+    ns = func.__module__.removeprefix("utils.")
+    entry = cli._tool_index()[f"{ns}__{func.__name__}"]
+    # The index keeps annotations as written, where inspect spells out `typing.Any`.
+    expected = str(inspect.signature(func, eval_str=True)).replace("typing.", "")
+    assert cli._format_signature(ns, func.__name__, entry) == expected
+
+
+@pytest.mark.parametrize("from_index", [True, False])
+def test_typed_args_coerces_numeric_parameters(cli: ModuleType, from_index: bool) -> None:
+    add_entry = cli._tool_index()["math__add"]
+    geo_entry = cli._tool_index()["geo_location__coordinates_by_name"]
+    if not from_index:
+        # Force the inspect-based path used when the index has no params.
+        add_entry = {**add_entry, "params": None}
+        geo_entry = {**geo_entry, "params": None}
+
+    assert cli._typed_args(add_entry, math_utils.add, ["1", "2.5"]) == [1.0, 2.5]
+    # geo_location uses `from __future__ import annotations`, so `limit: int` is a string.
+    typed = cli._typed_args(geo_entry, geo_location.coordinates_by_name, ["Paris", "FR", "2"])
+    assert typed == ["Paris", "FR", 2]
+    assert type(typed[2]) is int
+
+
+def _serve(
+    cli: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    *lines: str,
+) -> list[Any]:
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(f"{line}\n" for line in lines)))
+    cli._serve(cli._tool_index())
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_serve_answers_each_request_line(
+    cli: ModuleType, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    responses = _serve(
+        cli,
+        monkeypatch,
+        capsys,
+        '{"name": "math__add", "args": ["1", "2"]}',
+        "",
+        '{"name": "text__words_count", "args": ["one two"]}',
+    )
+    assert responses == [{"result": 3.0}, {"words": 2}]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "{not json",
+        '{"args": [1, 2]}',
+        '{"name": "math__nope", "args": [1, 2]}',
+        '{"name": "math__add", "args": "12"}',
+    ],
+)
+def test_serve_rejects_invalid_request(
+    cli: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    line: str,
+) -> None:
+    [response] = _serve(cli, monkeypatch, capsys, line)
+    assert response["error"].startswith("Invalid request: ")
+
+
+def test_serve_reports_tool_exception_and_keeps_going(
+    cli: ModuleType, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    responses = _serve(
+        cli,
+        monkeypatch,
+        capsys,
+        '{"name": "math__add", "args": ["1"]}',
+        # A negative base to a fractional power is complex, which JSON cannot encode.
+        '{"name": "math__power", "args": [-8, 0.5]}',
+        '{"name": "math__add", "args": ["1", "2"]}',
+    )
+    assert responses[0]["error"].startswith("Unexpected error: ")
+    assert responses[1]["error"].startswith("Unserializable result: ")
+    assert responses[2] == {"result": 3.0}
@@ -142,3 +142,30 @@ def _detect_country_code_from_locale_returns_string() -> None:
 
     result = _detect_country_code_from_locale()
     assert isinstance(result, str)
+
+
+def test_country_name_lookup_uses_cached_tables() -> None:
+    assert dt_utils._get_country_name("JP") == "Japan"
+    assert dt_utils._get_country_name("XX") == ""
+    assert dt_utils._get_zone_tab() is dt_utils._get_zone_tab()
+    assert dt_utils._get_country_codes() is dt_utils._get_country_codes()
+
+
+@pytest.mark.parametrize("zone", ["UTC", "America/St_Johns", "Asia/Kolkata", "Europe/Amsterdam"])
+def test_format_utc_offset_matches_strftime(zone: str) -> None:
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    for moment in (datetime(2026, 1, 15, 12), datetime(1900, 7, 1, 12)):
+        now = moment.replace(tzinfo=ZoneInfo(zone))
+        assert dt_utils._format_utc_offset(now) == now.strftime("%z")
+
+
+def test_detect_country_code_reads_locale_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for var in ("LC_ALL", "LC_CTYPE", "LANGUAGE"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("LANG", "ja_JP.UTF-8")
+    assert dt_utils._detect_country_code_from_locale() == "JP"
+
+    monkeypatch.setenv("LC_ALL", "C.UTF-8")
+    assert dt_utils._detect_country_code_from_locale() == ""
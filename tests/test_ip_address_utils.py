@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
+
+import pytest
+
 from utils import ip_address
 
 
@@ -19,3 +24,30 @@ def test_approximate_physical_location_uses_mock_source(
     assert payload["country"] == "US"
     assert payload["state_province"] == "California"
     assert payload["city"] == "Los Angeles"
+
+
+def test_public_ipv4_reuses_cached_payload(
+    ipinfo_source_url: str,
+    monkeypatch: pytest.MonkeyPatch,
+    no_network: Callable[[], None],
+) -> None:
+    monkeypatch.setattr(ip_address, "_payload_cache", OrderedDict())
+    first = ip_address.public_ipv4(source_url=ipinfo_source_url)
+
+    no_network()
+    assert ip_address.public_ipv4(source_url=ipinfo_source_url) == first
+
+
+def test_store_payload_drops_expired_and_caps_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ip_address, "_payload_cache", OrderedDict())
+    monkeypatch.setattr(ip_address, "_PAYLOAD_CACHE_MAX_ENTRIES", 3)
+
+    ip_address._store_payload("a", 0.0, {})
+    ip_address._store_payload("b", 100.0, {})
+    # "a" is past the TTL by now, so it is dropped on insert.
+    ip_address._store_payload("c", ip_address._PAYLOAD_TTL_SECONDS + 50.0, {})
+    assert list(ip_address._payload_cache) == ["b", "c"]
+
+    ip_address._store_payload("d", ip_address._PAYLOAD_TTL_SECONDS + 60.0, {})
+    ip_address._store_payload("e", ip_address._PAYLOAD_TTL_SECONDS + 70.0, {})
+    assert list(ip_address._payload_cache) == ["c", "d", "e"]
@@ -0,0 +1,64 @@
+"""Tests for the lazily-importing MCP tool stubs."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+import mcp_server
+from utils import datetime as datetime_utils
+from utils import math as math_utils
+from utils import text as text_utils
+from utils._tool_index import _build_tool_index
+
+
+@pytest.mark.parametrize(
+    ("qualified_name", "func"),
+    [
+        ("math__add", math_utils.add),
+        ("math__log", math_utils.log),
+        ("text__words_count", text_utils.words_count),
+        ("datetime__current", datetime_utils.current),
+    ],
+)
+def test_stub_signature_matches_real_function(
+    qualified_name: str, func: Callable[..., Any]
+) -> None:
+    stub = mcp_server._make_stub(_build_tool_index()[qualified_name])
+
+    assert stub is not func
+    assert inspect.signature(stub) == inspect.signature(func)
+    assert stub.__doc__ == inspect.getdoc(func)
+
+
+def test_stub_imports_module_only_on_first_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    imported: list[str] = []
+    real_import = mcp_server._cached_import
+
+    def counting_import(module_name: str) -> Any:
+        imported.append(module_name)
+        return real_import(module_name)
+
+    monkeypatch.setattr(mcp_server, "_cached_import", counting_import)
+    monkeypatch.setattr(mcp_server, "_RESOLVED", {})
+
+    stub = mcp_server._make_stub(_build_tool_index()["math__add"])
+    assert imported == []
+
+    assert stub(a=1, b=2) == {"result": 3.0}
+    assert stub(a=2, b=3) == {"result": 5.0}
+    assert imported == ["utils.math"]
+
+
+@pytest.mark.parametrize("annotation", ["pathlib.Path", "Decimal", "__import__('os').getcwd()"])
+def test_stub_falls_back_to_eager_import_for_unresolvable_annotation(
+    annotation: str,
+) -> None:
+    entry = dict(_build_tool_index()["math__add"])
+    entry["params"] = [{**entry["params"][0], "annotation": annotation}, entry["params"][1]]
+
+    assert mcp_server._stub_signature(entry) is None
+    assert mcp_server._make_stub(entry) is math_utils.add
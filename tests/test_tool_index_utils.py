@@ -0,0 +1,121 @@
+"""Tests for the static tool metadata index."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from utils import math as math_utils
+from utils._tool_index import _build_tool_index, _load_tool_index, _write_tool_index
+
+_DEMO_SOURCE = '"""Demo."""\n\n\ndef ping() -> dict:\n    pass\n'
+_PONG_SOURCE = "\n\ndef pong() -> dict:\n    pass\n"
+
+
+def test_build_tool_index_lists_public_functions() -> None:
+    index = _build_tool_index()
+    assert "math__add" in index
+    assert "datetime__current" in index
+    assert not any(name.split("__", 1)[1].startswith("_") for name in index)
+
+
+def test_build_tool_index_matches_runtime_signature() -> None:
+    entry = _build_tool_index()["math__log"]
+    sig = inspect.signature(math_utils.log)
+
+    assert entry["namespace"] == "math"
+    assert entry["function"] == "log"
+    assert entry["module_doc"] == (math_utils.__doc__ or "").strip().split("\n")[0]
+    assert entry["doc"] == (math_utils.log.__doc__ or "").strip()
+    assert [p["name"] for p in entry["params"]] == list(sig.parameters)
+    assert entry["params"][1]["default"] == sig.parameters["base"].default
+    assert entry["returns"] == "dict[str, Any]"
+
+
+def _demo_tree(tmp_path: Path) -> tuple[Path, Path]:
+    utils_dir = tmp_path / "utils"
+    utils_dir.mkdir()
+    (utils_dir / "demo.py").write_text(_DEMO_SOURCE, encoding="utf-8")
+    return utils_dir, tmp_path / "tools_index.json"
+
+
+def test_load_tool_index_uses_fresh_sidecar(tmp_path: Path) -> None:
+    utils_dir, index_path = _demo_tree(tmp_path)
+
+    written = _write_tool_index(index_path, utils_dir)
+    assert _load_tool_index(index_path, utils_dir) == written
+
+    sidecar = json.loads(index_path.read_text(encoding="utf-8"))
+    sidecar["tools"] = {"cached__only": {}}
+    index_path.write_text(json.dumps(sidecar), encoding="utf-8")
+    assert "cached__only" in _load_tool_index(index_path, utils_dir)
+
+
+def test_load_tool_index_rebuilds_stale_sidecar(tmp_path: Path) -> None:
+    utils_dir, index_path = _demo_tree(tmp_path)
+    index_path.write_text(json.dumps({"cached__only": {}}), encoding="utf-8")
+    os.utime(index_path, ns=(0, 0))
+
+    assert list(_load_tool_index(index_path, utils_dir)) == ["demo__ping"]
+
+
+def test_load_tool_index_detects_renamed_module(tmp_path: Path) -> None:
+    utils_dir, index_path = _demo_tree(tmp_path)
+    _write_tool_index(index_path, utils_dir)
+
+    # A rename keeps the file's mtime, so only the manifest can notice it.
+    (utils_dir / "demo.py").rename(utils_dir / "bar.py")
+
+    assert list(_load_tool_index(index_path, utils_dir)) == ["bar__ping"]
+    sidecar = json.loads(index_path.read_text(encoding="utf-8"))
+    assert list(sidecar["modules"]) == ["bar.py"]
+    assert list(sidecar["tools"]) == ["bar__ping"]
+
+
+def test_load_tool_index_detects_deleted_module(tmp_path: Path) -> None:
+    utils_dir, index_path = _demo_tree(tmp_path)
+    _write_tool_index(index_path, utils_dir)
+
+    (utils_dir / "demo.py").unlink()
+
+    assert _load_tool_index(index_path, utils_dir) == {}
+
+
+def test_build_tool_index_honors_dunder_all(tmp_path: Path) -> None:
+    source = '__all__ = ["ping"]\n' + _DEMO_SOURCE + _PONG_SOURCE
+    (tmp_path / "demo.py").write_text(source, encoding="utf-8")
+    assert list(_build_tool_index(tmp_path)) == ["demo__ping"]
+
+
+def test_build_tool_index_honors_annotated_dunder_all(tmp_path: Path) -> None:
+    source = '__all__: list[str] = ["ping"]\n' + _DEMO_SOURCE + _PONG_SOURCE
+    (tmp_path / "demo.py").write_text(source, encoding="utf-8")
+    assert list(_build_tool_index(tmp_path)) == ["demo__ping"]
+
+
+@pytest.mark.parametrize("value", ['"ping"', "None", "[1, 2]", "{'ping': 1}"])
+def test_build_tool_index_ignores_malformed_dunder_all(tmp_path: Path, value: str) -> None:
+    source = f"__all__ = {value}\n" + _DEMO_SOURCE + _PONG_SOURCE
+    (tmp_path / "demo.py").write_text(source, encoding="utf-8")
+    assert list(_build_tool_index(tmp_path)) == ["demo__ping", "demo__pong"]
+
+
+@pytest.mark.parametrize("default", ['b"a"', "(1, 2)", "{1}", "1j", "[1]"])
+def test_load_tool_index_skips_non_json_defaults(tmp_path: Path, default: str) -> None:
+    utils_dir, index_path = _demo_tree(tmp_path)
+    (utils_dir / "demo.py").write_text(
+        f"def ping(x: object = {default}) -> dict:\n    pass\n", encoding="utf-8"
+    )
+
+    assert _load_tool_index(index_path, utils_dir)["demo__ping"]["params"] is None
+    # The reloaded sidecar agrees with the fresh build.
+    assert _load_tool_index(index_path, utils_dir)["demo__ping"]["params"] is None
+
+
+def test_build_tool_index_precomputes_description() -> None:
+    entry = _build_tool_index()["math__add"]
+    assert entry["description"] == f"[math] {entry['module_doc']}\n\n{entry['doc']}"
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import subprocess
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -82,3 +85,99 @@ def test_personal_data_missing_required_fields_raises(
 
     with pytest.raises(FileNotFoundError):
         user_information.personal_data()
+
+
+@pytest.mark.usefixtures("no_subprocess")
+def test_get_username_reads_passwd_without_subprocess(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entry = SimpleNamespace(pw_name="jane", pw_gecos="Jane Doe,Room 1,,")
+    monkeypatch.setattr(user_information, "_get_passwd_entry", lambda: entry)
+
+    assert user_information._get_username() == "jane"
+    assert user_information._get_full_name() == "Jane Doe"
+
+
+def test_personal_data_reparses_config_only_when_changed(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    config = tmp_path / "user.data.json"
+    fields = {
+        "name": "Jane",
+        "birthday": "1990-01-31",
+        "email": "jane@example.com",
+        "phone": "+1-555-123-4567",
+        "addresses": ["123 Main St"],
+        "timezone": "UTC",
+    }
+    config.write_text(json.dumps(fields), encoding="utf-8")
+    monkeypatch.setattr(user_information, "_CONFIG_PATH", config)
+    monkeypatch.setattr(user_information, "_config_cache", {})
+
+    assert user_information._load_config() is user_information._load_config()
+    assert user_information.personal_data()["email"] == "jane@example.com"
+
+    config.write_text(json.dumps({**fields, "email": "j.doe@example.com"}), encoding="utf-8")
+    assert user_information.personal_data()["email"] == "j.doe@example.com"
+
+
+def test_personal_data_results_do_not_share_cached_objects(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    config = tmp_path / "user.data.json"
+    fields = {
+        "name": {"first": "Jane", "last": "Doe"},
+        "birthday": "1990-01-31",
+        "email": "jane@example.com",
+        "phone": "+1-555-123-4567",
+        "addresses": ["123 Main St"],
+        "timezone": "UTC",
+    }
+    config.write_text(json.dumps(fields), encoding="utf-8")
+    monkeypatch.setattr(user_information, "_CONFIG_PATH", config)
+    monkeypatch.setattr(user_information, "_config_cache", {})
+
+    first = user_information.personal_data()
+    first["name"]["first"] = "Mallory"
+    first["addresses"].append("456 Side St")
+
+    second = user_information.personal_data()
+    assert second["name"] == {"first": "Jane", "last": "Doe"}
+    assert second["addresses"] == ["123 Main St"]
+
+
+@pytest.mark.usefixtures("no_subprocess")
+def test_get_full_name_skips_subprocess_when_gecos_is_empty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entry = SimpleNamespace(pw_name="jane", pw_gecos="")
+    monkeypatch.setattr(user_information, "_get_passwd_entry", lambda: entry)
+    monkeypatch.setattr(user_information.sys, "platform", "linux")
+
+    assert user_information._get_full_name() == "jane"
+
+
+@pytest.mark.usefixtures("no_subprocess")
+def test_get_username_uses_environment_without_passwd_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(user_information, "_get_passwd_entry", lambda: None)
+    monkeypatch.setenv("USER", "jane")
+
+    assert user_information._get_username() == "jane"
+
+
+def test_get_username_returns_empty_when_id_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(user_information, "_get_passwd_entry", lambda: None)
+    monkeypatch.setattr(user_information.sys, "platform", "linux")
+    for var in ("USER", "LOGNAME", "USERNAME"):
+        monkeypatch.delenv(var, raising=False)
+
+    def fail_id(*args: Any, **kwargs: Any) -> None:
+        raise subprocess.CalledProcessError(1, ["id", "-un"])
+
+    monkeypatch.setattr(subprocess, "run", fail_id)
+    assert user_information._get_username() == ""
+    assert user_information._get_full_name() == ""
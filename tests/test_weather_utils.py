@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
 from utils import weather
 
 
@@ -22,3 +28,93 @@ def test_temperature_unit_for_country_supports_alpha2_and_alpha3() -> None:
     assert weather.temperature_unit_for_country("US")["default_unit"] == ("fahrenheit")
     assert weather.temperature_unit_for_country("USA")["default_unit"] == ("fahrenheit")
     assert weather.temperature_unit_for_country("FR")["default_unit"] == ("celsius")
+
+
+def test_current_with_forecast_reuses_cached_page(
+    weather_source_url: str,
+    monkeypatch: pytest.MonkeyPatch,
+    no_network: Callable[[], None],
+) -> None:
+    monkeypatch.setattr(weather, "_page_cache", OrderedDict())
+    first = weather.current_with_forecast(0, 0, unit="f", source_url=weather_source_url)
+
+    no_network()
+    monkeypatch.setattr(weather, "_parse_page", None)
+    assert weather.current_with_forecast(0, 0, unit="f", source_url=weather_source_url) == first
+    assert weather.current_with_forecast(0, 0, unit="c", source_url=weather_source_url) != first
+
+
+def test_store_page_drops_expired_and_caps_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(weather, "_page_cache", OrderedDict())
+    monkeypatch.setattr(weather, "_PAGE_CACHE_MAX_ENTRIES", 3)
+
+    page = ("", {}, [])
+    weather._store_page("a", 0.0, page)
+    weather._store_page("b", 100.0, page)
+    # "a" is past the TTL by now, so it is dropped on insert.
+    weather._store_page("c", weather._PAGE_TTL_SECONDS + 50.0, page)
+    assert list(weather._page_cache) == ["b", "c"]
+
+    weather._store_page("d", weather._PAGE_TTL_SECONDS + 60.0, page)
+    weather._store_page("e", weather._PAGE_TTL_SECONDS + 70.0, page)
+    assert list(weather._page_cache) == ["c", "d", "e"]
+
+
+def test_current_with_forecast_does_not_cache_pages_without_forecast(
+    fixture_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(weather, "_page_cache", OrderedDict())
+    page = tmp_path / "weather.html"
+    page.write_text("<p>Down for maintenance</p>", encoding="utf-8")
+    assert "error" in weather.current_with_forecast(0, 0, unit="f", source_url=page.as_uri())
+    assert not weather._page_cache
+
+    # Once the real page is back, the next call sees it right away.
+    page.write_bytes((fixture_dir / "weather.mock.html").read_bytes())
+    result = weather.current_with_forecast(0, 0, unit="f", source_url=page.as_uri())
+    assert "error" not in result
+    assert list(weather._page_cache) == [page.as_uri()]
+
+
+@pytest.mark.usefixtures("no_subprocess")
+def test_prefer_celsius_reads_macos_plist_without_subprocess(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(weather.sys, "platform", "darwin")
+    monkeypatch.setattr(
+        weather,
+        "_read_global_preferences",
+        lambda: {"AppleTemperatureUnit": "Celsius"},
+    )
+    assert weather._prefer_celsius.__wrapped__() is True
+
+
+def test_current_with_forecast_converts_without_touching_cached_parse(
+    weather_source_url: str,
+) -> None:
+    fahrenheit = weather.current_with_forecast(0, 0, unit="f", source_url=weather_source_url)
+    celsius = weather.current_with_forecast(0, 0, unit="c", source_url=weather_source_url)
+    again = weather.current_with_forecast(0, 0, unit="f", source_url=weather_source_url)
+
+    assert again == fahrenheit
+    assert celsius["unit"] == "celsius"
+    assert celsius["forecast"][0]["temperature"] != fahrenheit["forecast"][0]["temperature"]
+
+
+def test_fetch_weather_html_decodes_gzip_responses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import gzip
+    import io
+    from email.message import Message
+
+    class GzipResponse(io.BytesIO):
+        headers = Message()
+
+    GzipResponse.headers["Content-Encoding"] = "gzip"
+    resp = GzipResponse(gzip.compress("<p>72°F</p>".encode()))
+
+    monkeypatch.setattr(weather.urllib.request, "urlopen", lambda *a, **k: resp)
+    assert weather._fetch_weather_html("https://example.invalid/") == "<p>72°F</p>"
@@ -3,72 +3,184 @@
 CLI entry point that auto-discovers public functions from utils/*.py modules.
 """
 
-import importlib
+import functools
 import inspect
+import json
 import pathlib
 import sys
 from collections.abc import Callable
 from typing import Any
 
+from utils._tool_index import _cached_import, _load_tool_index
 
+# Tool results are plain acyclic dicts, so skip the circular-reference check.
+_encode_json = json.JSONEncoder(indent=2, check_circular=False).encode
+
+
+@functools.cache
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return the (memoized) signature of a discovered function.
+
+    String annotations (modules using `from __future__ import
+    annotations`) are evaluated so they can drive argument coercion.
+    """
+    return inspect.signature(func, eval_str=True)
+
+
+# Annotations (as written in the source) that CLI string arguments are coerced to.
+_COERCERS: dict[str, Callable[[Any], Any]] = {"int": int, "float": float}
+
+
+@functools.cache
+def _signature_coercers(func: Callable[..., Any]) -> tuple[Callable[[Any], Any] | None, ...]:
+    """Return one int/float coercer (or None) per parameter, via inspect."""
+    return tuple(
+        param.annotation if param.annotation in (int, float) else None
+        for param in _signature(func).parameters.values()
+    )
+
+
+def _arg_coercers(
+    entry: dict[str, Any], func: Callable[..., Any]
+) -> tuple[Callable[[Any], Any] | None, ...]:
+    """Return one int/float coercer (or None) per positional parameter.
+
+    Read from the index's annotation strings when available, so no
+    `inspect.Signature` is built on the call path.
+    """
+    if entry["params"] is None:
+        return _signature_coercers(func)
+    return tuple(_COERCERS.get(param.get("annotation", "")) for param in entry["params"])
+
+
+def _resolve(namespace: str, func_name: str) -> Callable[..., Any]:
+    """Import `utils.{namespace}` (if needed) and return the function."""
+    return getattr(_cached_import(f"utils.{namespace}"), func_name)
+
+
+@functools.cache
+def _tool_index() -> dict[str, dict[str, Any]]:
+    """Return the flat tool index, keyed by `namespace__function`."""
+    project_dir = pathlib.Path(__file__).parent
+    return _load_tool_index(project_dir / "tools_index.json", project_dir / "utils")
+
+
+@functools.cache
 def _discover_functions() -> tuple[
-    dict[str, dict[str, Callable[..., Any]]],
+    dict[str, dict[str, dict[str, Any]]],
     dict[str, str],
 ]:
-    """Dynamically import all public functions from
-    utils/*.py modules.
+    """Read all public functions of utils/*.py modules from the
+    static tool index, without importing any of them.
 
     Returns:
         Tuple of:
-          - Nested dict: {namespace: {func_name: callable}}
+          - Nested dict: {namespace: {func_name: index entry}}
           - Module docs: {namespace: docstring}
     """
-    result: dict[str, dict[str, Callable[..., Any]]] = {}
+    result: dict[str, dict[str, dict[str, Any]]] = {}
     docs: dict[str, str] = {}
-    utils_dir = pathlib.Path(__file__).parent / "utils"
 
-    for module_path in sorted(utils_dir.glob("*.py")):
-        if module_path.name.startswith("_"):
-            continue
+    for entry in _tool_index().values():
+        ns = entry["namespace"]
+        result.setdefault(ns, {})[entry["function"]] = entry
+        docs[ns] = entry["module_doc"]
 
-        ns = module_path.stem
-        module_name = f"utils.{ns}"
-        module = importlib.import_module(module_name)
+    return result, docs
 
-        funcs: dict[str, Callable[..., Any]] = {}
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            if not name.startswith("_") and obj.__module__ == module.__name__:
-                funcs[name] = obj
 
-        if funcs:
-            result[ns] = funcs
-            docs[ns] = (module.__doc__ or "").strip().split("\n")[0]
+def _format_signature(ns: str, name: str, entry: dict[str, Any]) -> str:
+    """Render a signature like `inspect.Signature` does, from index data."""
+    if entry["params"] is None:
+        return str(_signature(_resolve(ns, name)))
 
-    return result, docs
+    params: list[str] = []
+    for param in entry["params"]:
+        text = param["name"]
+        annotation = param.get("annotation")
+        if annotation is not None:
+            text += f": {annotation}"
+        if "default" in param:
+            sep = " = " if annotation is not None else "="
+            text += f"{sep}{param['default']!r}"
+        params.append(text)
+    returns = f" -> {entry['returns']}" if entry["returns"] is not None else ""
+    return f"({', '.join(params)}){returns}"
 
 
 def _print_namespace_functions(
     ns: str,
-    funcs: dict[str, Callable[..., Any]],
+    funcs: dict[str, dict[str, Any]],
 ) -> None:
     """Print all functions in a namespace with signatures
     and docstrings."""
-    for name, func in funcs.items():
-        sig = inspect.signature(func)
-        doc = (func.__doc__ or "").strip().split("\n")[0]
+    for name, entry in funcs.items():
+        sig = _format_signature(ns, name, entry)
+        doc = entry["doc"].split("\n")[0]
         print(f"  [func] {ns}__{name}{sig}")
         if doc:
             print(f"         {doc}")
         print()
 
 
+def _typed_args(entry: dict[str, Any], func: Callable[..., Any], func_args: list[Any]) -> list[Any]:
+    """Coerce positional CLI arguments to the function's int/float hints."""
+    return [
+        arg if coerce is None else coerce(arg)
+        for arg, coerce in zip(func_args, _arg_coercers(entry, func), strict=False)
+    ]
+
+
+def _serve(index: dict[str, dict[str, Any]]) -> None:
+    """Answer one JSON request per stdin line until EOF.
+
+    Each request is `{"name": "<namespace__function>", "args": [...]}`
+    and each response is the JSON-encoded result on a single line, so
+    callers pay the interpreter and module import cost only once.
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            entry = index.get(request["name"])
+            if entry is None:
+                raise KeyError(request["name"])
+            func_args = request.get("args", [])
+            if not isinstance(func_args, list):
+                raise TypeError(f"args must be a list, not {type(func_args).__name__}")
+            func = _resolve(entry["namespace"], entry["function"])
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            result: Any = {"error": f"Invalid request: {e!s}"}
+        else:
+            try:
+                result = func(*_typed_args(entry, func, func_args))
+            except Exception as e:
+                result = {"error": f"Unexpected error: {e!s}"}
+        try:
+            response = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            response = json.dumps({"error": f"Unserializable result: {e!s}"})
+        print(response, flush=True)
+
+
 def main() -> None:
     """CLI entry point."""
-    import json
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "ls"
 
-    namespaces, ns_docs = _discover_functions()
+    # --- function call (fast path: one lookup in the flat index) ---
+    entry = _tool_index().get(cmd)
+    if entry is not None:
+        func = _resolve(entry["namespace"], entry["function"])
+        print(_encode_json(func(*_typed_args(entry, func, sys.argv[2:]))))
+        return
 
-    cmd = sys.argv[1] if len(sys.argv) > 1 else "ls"
+    # --- serve command ---
+    if cmd == "serve":
+        _serve(_tool_index())
+        sys.exit(0)
+
+    namespaces, ns_docs = _discover_functions()
 
     # --- ls command ---
     if cmd == "ls":
@@ -93,9 +205,8 @@ def main() -> None:
                 print()
         sys.exit(0)
 
-    # --- function call ---
+    # --- unknown function: explain what is available ---
     qualified_name = cmd
-    func_args = sys.argv[2:]
 
     if "__" not in qualified_name:
         print("Error: Use <namespace__function> format, eg: datetime__current")
@@ -109,27 +220,9 @@ def main() -> None:
         print("Available namespaces: " + ", ".join(namespaces))
         sys.exit(1)
 
-    if func_name not in namespaces[namespace]:
-        print(f"Error: Unknown function '{func_name}' in '{namespace}'")
-        print("Available functions: " + ", ".join(namespaces[namespace]))
-        sys.exit(1)
-
-    func = namespaces[namespace][func_name]
-    sig = inspect.signature(func)
-    typed_args: list[Any] = []
-    for arg, param in zip(
-        func_args,
-        sig.parameters.values(),
-        strict=False,
-    ):
-        hint = param.annotation
-        if hint in (int, float):
-            typed_args.append(hint(arg))
-        else:
-            typed_args.append(arg)
-
-    result = func(*typed_args)
-    print(json.dumps(result, indent=2))
+    print(f"Error: Unknown function '{func_name}' in '{namespace}'")
+    print("Available functions: " + ", ".join(namespaces[namespace]))
+    sys.exit(1)
 
 
 if __name__ == "__main__":
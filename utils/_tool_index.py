@@ -0,0 +1,214 @@
+"""Static tool metadata index built from utils/*.py sources."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import json
+import os
+import pathlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import ast
+
+_UTILS_DIR = pathlib.Path(__file__).parent
+_INDEX_PATH = _UTILS_DIR.parent / "tools_index.json"
+
+
+def _cached_import(module_name: str) -> ModuleType:
+    """Return an already-imported module, importing it only on a miss."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+def _first_line(doc: str | None) -> str:
+    """Return the first line of a docstring, or an empty string."""
+    return (doc or "").strip().split("\n")[0]
+
+
+def _module_files(utils_dir: pathlib.Path) -> list[os.DirEntry[str]]:
+    """List the public utils/*.py files, sorted by name."""
+    with os.scandir(utils_dir) as it:
+        entries = [
+            e for e in it if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _module_manifest(utils_dir: pathlib.Path) -> dict[str, int]:
+    """Map each public utils/*.py file name to its mtime in nanoseconds."""
+    return {e.name: e.stat().st_mtime_ns for e in _module_files(utils_dir)}
+
+
+def _param_entries(args: ast.arguments) -> list[dict[str, Any]] | None:
+    """Describe a function's parameters as JSON-friendly dicts.
+
+    Returns None when the signature cannot be described statically
+    (positional-only, *args/**kwargs, or defaults other than None,
+    bool, int, float, or str literals).
+    """
+    import ast
+
+    if args.posonlyargs or args.vararg or args.kwarg or args.kwonlyargs:
+        return None
+
+    params: list[dict[str, Any]] = []
+    first_default = len(args.args) - len(args.defaults)
+    for index, arg in enumerate(args.args):
+        param: dict[str, Any] = {"name": arg.arg}
+        if arg.annotation is not None:
+            param["annotation"] = ast.unparse(arg.annotation)
+        if index >= first_default:
+            try:
+                default = ast.literal_eval(args.defaults[index - first_default])
+            except ValueError:
+                return None
+            # Only scalars survive a JSON round trip unchanged.
+            if default is not None and not isinstance(default, bool | int | float | str):
+                return None
+            param["default"] = default
+        params.append(param)
+    return params
+
+
+def _exported_names(tree: ast.Module) -> set[str] | None:
+    """Return the literal `__all__` of a module, or None if it has none.
+
+    Only a list or tuple of strings counts; any other value (or one
+    that is not a literal) is treated as if `__all__` were absent.
+    """
+    import ast
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target, value = node.target, node.value
+        else:
+            continue
+        if not (isinstance(target, ast.Name) and target.id == "__all__"):
+            continue
+        try:
+            names = ast.literal_eval(value)
+        except ValueError:
+            return None
+        if isinstance(names, list | tuple) and all(isinstance(n, str) for n in names):
+            return set(names)
+        return None
+    return None
+
+
+def _module_entries(namespace: str, source: str | bytes) -> dict[str, dict[str, Any]]:
+    """Extract tool metadata for the public functions of one module.
+
+    A module-level `__all__` narrows the exported set when present.
+    """
+    import ast
+
+    tree = ast.parse(source)
+    module_doc = _first_line(ast.get_docstring(tree))
+    exported = _exported_names(tree)
+    # Description pieces shared by every tool in the module.
+    prefix = f"[{namespace}] {module_doc}\n\n" if module_doc else ""
+    undocumented = f"[{namespace}] utility function"
+
+    entries: dict[str, dict[str, Any]] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+        if node.name.startswith("_"):
+            continue
+        if exported is not None and node.name not in exported:
+            continue
+        doc = (ast.get_docstring(node) or "").strip()
+        entries[f"{namespace}__{node.name}"] = {
+            "namespace": namespace,
+            "function": node.name,
+            "module_doc": module_doc,
+            "doc": doc,
+            "description": prefix + doc if doc else undocumented,
+            "params": _param_entries(node.args),
+            "returns": ast.unparse(node.returns) if node.returns is not None else None,
+        }
+    return entries
+
+
+def _build_tool_index(utils_dir: pathlib.Path = _UTILS_DIR) -> dict[str, dict[str, Any]]:
+    """Build the tool index without importing any utils module.
+
+    Args:
+        utils_dir: Directory holding the namespace modules.
+
+    Returns:
+        Dict keyed by `{namespace}__{function}` with `namespace`,
+        `function`, `module_doc` (first line), `doc`, the MCP tool
+        `description`, `params` (None if not statically describable),
+        and `returns`.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    for entry in _module_files(utils_dir):
+        # ast.parse decodes the bytes itself (honoring PEP 263 headers).
+        with open(entry.path, "rb") as f:
+            source = f.read()
+        index.update(_module_entries(entry.name[:-3], source))
+    return index
+
+
+def _save_tool_index(
+    index_path: pathlib.Path,
+    modules: dict[str, int],
+    index: dict[str, dict[str, Any]],
+) -> None:
+    """Atomically write the sidecar with the module manifest it was built from."""
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"modules": modules, "tools": index}, f, indent=2)
+        os.replace(tmp_path, index_path)
+    finally:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _write_tool_index(
+    index_path: pathlib.Path = _INDEX_PATH,
+    utils_dir: pathlib.Path = _UTILS_DIR,
+) -> dict[str, dict[str, Any]]:
+    """Build the tool index and save it as a JSON sidecar."""
+    # Snapshot mtimes before parsing so an edit made mid-build reads as stale.
+    modules = _module_manifest(utils_dir)
+    index = _build_tool_index(utils_dir)
+    _save_tool_index(index_path, modules, index)
+    return index
+
+
+def _load_tool_index(
+    index_path: pathlib.Path = _INDEX_PATH,
+    utils_dir: pathlib.Path = _UTILS_DIR,
+) -> dict[str, dict[str, Any]]:
+    """Load the JSON sidecar, or rebuild the index if it is missing or stale.
+
+    The sidecar is stale when its recorded module names and mtimes
+    differ from the current utils/*.py files (so added, renamed,
+    deleted, and edited modules are all caught), or when this indexer
+    is newer than it. A rebuilt index is written back best-effort.
+    """
+    modules = _module_manifest(utils_dir)
+    try:
+        if os.stat(__file__).st_mtime_ns <= index_path.stat().st_mtime_ns:
+            with open(index_path, encoding="utf-8") as f:
+                sidecar = json.load(f)
+            if isinstance(sidecar, dict) and sidecar.get("modules") == modules:
+                return sidecar["tools"]
+    except (OSError, ValueError, KeyError):
+        pass
+    index = _build_tool_index(utils_dir)
+    with contextlib.suppress(OSError):
+        _save_tool_index(index_path, modules, index)
+    return index
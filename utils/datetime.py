@@ -1,6 +1,7 @@
 """Date and time utilities."""
 
-from datetime import datetime
+import functools
+from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfo, available_timezones
 
@@ -54,6 +55,12 @@ _ABBREV_TO_IANA: dict[str, str] = {
 }
 
 
+@functools.cache
+def _available_timezones() -> frozenset[str]:
+    """Return the IANA keys known to zoneinfo (scanned once per process)."""
+    return frozenset(available_timezones())
+
+
 def _resolve_timezone(
     time_zone: str,
 ) -> ZoneInfo | None:
@@ -80,7 +87,7 @@ def _resolve_timezone(
         return ZoneInfo(iana)
 
     # Try as-is in case it's a valid IANA key (e.g. "UTC")
-    if time_zone in available_timezones():
+    if time_zone in _available_timezones():
         return ZoneInfo(time_zone)
 
     return None
@@ -285,38 +292,44 @@ _ISO_3166_COUNTRIES: dict[str, str] = {
 }
 
 
+@functools.cache
 def _get_country_codes() -> dict[str, str]:
     """Parse iso3166.tab to build a country-name -> country-code mapping.
 
     Tries to read from system file first, falls back to embedded mapping.
+    Parsed once per process; callers must not mutate the result.
     """
     try:
         with open("/usr/share/zoneinfo/iso3166.tab", encoding="utf-8") as f:
-            mapping: dict[str, str] = {}
-            for line in f:
-                if line.startswith("#") or not line.strip():
-                    continue
-                code, name = line.strip().split("\t", 1)
-                mapping[name.lower()] = code.upper()
-            return mapping
+            lines = f.read().splitlines()
+        mapping: dict[str, str] = {}
+        for line in lines:
+            if not line or line[0] == "#":
+                continue
+            code, name = line.split("\t", 1)
+            mapping[name.strip().lower()] = code.upper()
+        return mapping
     except (FileNotFoundError, OSError):
         return {k: v.upper() for k, v in _ISO_3166_COUNTRIES.items()}
 
 
+@functools.cache
 def _get_zone_tab() -> dict[str, list[str]]:
     """Parse zone.tab to build a country-code -> timezones mapping.
 
     Tries to read from system file first, falls back to embedded mapping.
+    Parsed once per process; callers must not mutate the result.
     """
     try:
-        mapping: dict[str, list[str]] = {}
         with open("/usr/share/zoneinfo/zone.tab", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("#") or not line.strip():
-                    continue
-                parts = line.strip().split("\t")
-                code, tz_name = parts[0], parts[2]
-                mapping.setdefault(code, []).append(tz_name)
+            lines = f.read().splitlines()
+        mapping: dict[str, list[str]] = {}
+        for line in lines:
+            if not line or line[0] == "#":
+                continue
+            # Columns: code, coordinates, TZ, optional comments.
+            code, _, tz_name = line.split("\t", 3)[:3]
+            mapping.setdefault(code, []).append(tz_name.strip())
         return mapping
     except (FileNotFoundError, OSError):
         # Fallback: common timezones by country (non-exhaustive)
@@ -401,23 +414,46 @@ def _get_zone_tab() -> dict[str, list[str]]:
 
 
 def _detect_country_code_from_locale() -> str:
-    """Detect country code from the system locale."""
-    import locale
+    """Detect country code from the system locale.
 
-    loc: str = locale.getlocale()[0] or locale.getdefaultlocale()[0] or ""
-    # Locale is like "en_US" — extract the country code part
+    Reads the locale environment variables in the order the `locale`
+    module consults them, without importing it.
+    """
+    import os
+
+    loc = ""
+    for var in ("LC_ALL", "LC_CTYPE", "LANG", "LANGUAGE"):
+        loc = os.environ.get(var, "")
+        if loc:
+            break
+    # Locale is like "en_US.UTF-8" — extract the country code part
     if "_" in loc:
         return loc.split("_")[1][:2].upper()
     return ""
 
 
+@functools.cache
+def _get_code_to_country() -> dict[str, str]:
+    """Build a country-code -> title-cased country-name mapping."""
+    return {code: name.title() for name, code in _get_country_codes().items()}
+
+
 def _get_country_name(code: str) -> str:
     """Look up a country name by its ISO 3166 code."""
-    country_codes = _get_country_codes()
-    for name, c in country_codes.items():
-        if c == code:
-            return name.title()
-    return ""
+    return _get_code_to_country().get(code, "")
+
+
+def _format_utc_offset(now: datetime) -> str:
+    """Format the UTC offset of `now` as `+HHMM`, like `strftime("%z")`."""
+    offset = now.utcoffset()
+    if offset is None:
+        return ""
+    total = int(offset.total_seconds())
+    sign = "-" if total < 0 else "+"
+    hours, rest = divmod(abs(total), 3600)
+    minutes, seconds = divmod(rest, 60)
+    text = f"{sign}{hours:02d}{minutes:02d}"
+    return f"{text}{seconds:02d}" if seconds else text
 
 
 def current(time_zone: str = "") -> dict[str, Any]:
@@ -433,6 +469,7 @@ def current(time_zone: str = "") -> dict[str, Any]:
         `iso8601`, and `unix_timestamp`) and `timezone` (containing
         IANA `name`, `code` abbreviation, and `utc_offset`).
     """
+    now: datetime | None = None
     if time_zone:
         tz = _resolve_timezone(time_zone)
         if tz is None:
@@ -445,24 +482,23 @@ def current(time_zone: str = "") -> dict[str, Any]:
                 )
             }
     else:
+        tz = None
         try:
             from utils.user_information import personal_data
 
             user_info = personal_data()
             user_tz = (user_info.get("timezone", "") or "").strip()
-            tz = None
             if user_tz:
                 tz = _resolve_timezone(user_tz)
-            if tz is None:
-                tz = datetime.now().astimezone().tzinfo
-                if tz is None:
-                    tz = ZoneInfo("UTC")
         except Exception:
-            tz = datetime.now().astimezone().tzinfo
-            if tz is None:
-                tz = ZoneInfo("UTC")
+            tz = None
+        if tz is None:
+            # System local time; this one clock read also yields the tzinfo.
+            now = datetime.now().astimezone()
+            tz = now.tzinfo or ZoneInfo("UTC")
 
-    now = datetime.now(tz)
+    if now is None:
+        now = datetime.now(tz)
     iana_name = str(tz)
 
     return {
@@ -473,8 +509,8 @@ def current(time_zone: str = "") -> dict[str, Any]:
         },
         "timezone": {
             "name": iana_name,
-            "code": now.strftime("%Z"),
-            "utc_offset": now.strftime("%z"),
+            "code": now.tzname() or "",
+            "utc_offset": _format_utc_offset(now),
         },
     }
 
@@ -530,15 +566,16 @@ def country_timezones(country_code: str = "") -> dict[str, Any]:
     tz_names = zone_tab[country_code]
     country_name = _get_country_name(country_code)
 
+    # One clock read so every zone reports the same instant.
+    now_utc = datetime.now(UTC)
     timezones: list[dict[str, str]] = []
     for name in sorted(tz_names):
-        tz = ZoneInfo(name)
-        now = datetime.now(tz)
+        now = now_utc.astimezone(ZoneInfo(name))
         timezones.append(
             {
                 "name": name,
-                "code": now.strftime("%Z"),
-                "utc_offset": now.strftime("%z"),
+                "code": now.tzname() or "",
+                "utc_offset": _format_utc_offset(now),
             }
         )
 
@@ -1,20 +1,55 @@
 """Public IP address & approximate location utilities."""
 
 import json
+import time
 import urllib.request
+from collections import OrderedDict
 from typing import Any
 
 _IPINFO_URL = "https://ipinfo.io/json"
 
+# Public IP and location rarely change within minutes, so successful
+# payloads are reused per source URL for this long. Entries are kept in
+# fetch order and capped, since callers choose the source URL.
+_PAYLOAD_TTL_SECONDS = 300.0
+_PAYLOAD_CACHE_MAX_ENTRIES = 32
+_payload_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _store_payload(source_url: str, now: float, data: dict[str, Any]) -> None:
+    """Cache a fetched payload, dropping expired and excess older entries."""
+    _payload_cache.pop(source_url, None)
+    # Oldest fetches come first, so stop at the first live entry once under the cap.
+    while _payload_cache:
+        fetched_at = next(iter(_payload_cache.values()))[0]
+        if (
+            now - fetched_at < _PAYLOAD_TTL_SECONDS
+            and len(_payload_cache) < _PAYLOAD_CACHE_MAX_ENTRIES
+        ):
+            break
+        _payload_cache.popitem(last=False)
+    _payload_cache[source_url] = (now, data)
+
 
 def _load_ipinfo_payload(source_url: str) -> dict[str, Any]:
-    """Fetch IP payload JSON from a URL-like source."""
+    """Fetch IP payload JSON from a URL-like source.
+
+    Results are cached per URL for `_PAYLOAD_TTL_SECONDS`; callers
+    must not mutate the returned dict.
+    """
+    now = time.monotonic()
+    cached = _payload_cache.get(source_url)
+    if cached is not None and now - cached[0] < _PAYLOAD_TTL_SECONDS:
+        return cached[1]
+
     req = urllib.request.Request(
         source_url,
         headers={"Accept": "application/json"},
     )
     with urllib.request.urlopen(req, timeout=10) as resp:
-        return json.loads(resp.read().decode())
+        data = json.load(resp)
+    _store_payload(source_url, now, data)
+    return data
 
 
 def public_ipv4(source_url: str = "") -> dict[str, Any]:
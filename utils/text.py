@@ -30,10 +30,11 @@ def characters_count(text: str) -> dict[str, Any]:
     """
     if not isinstance(text, str):
         return {"error": "Input must be a string"}
+    total = len(text)
     return {
         "characters": {
-            "with_spaces": len(text),
-            "excluding_spaces": len(text.replace(" ", "")),
+            "with_spaces": total,
+            "excluding_spaces": total - text.count(" "),
         },
     }
 
@@ -1,85 +1,95 @@
 """Current user's personal information utilities."""
 
+import copy
+import functools
 import json
 import os
 import pathlib
-import subprocess
+import sys
 from datetime import date
 from typing import Any
 
 
+@functools.cache
+def _get_passwd_entry() -> Any | None:
+    """Return the current user's POSIX account entry, or None.
+
+    Looked up once per process, since the UID does not change.
+    """
+    try:
+        import pwd
+
+        return pwd.getpwuid(os.getuid())
+    except (ImportError, KeyError, OSError, AttributeError):
+        return None
+
+
 def _get_full_name() -> str:
     """Get the current user's full name across macOS/Linux.
 
     Preference order:
       1) POSIX account GECOS field
       2) macOS `id -F`
-      3) Linux `getent passwd <user>` GECOS field
-      4) Fallback to username
+      3) Fallback to username
     """
     # 1) POSIX account metadata (works in most Unix environments,
     # including Alpine).
-    try:
-        import pwd
-
-        gecos = pwd.getpwuid(os.getuid()).pw_gecos.split(",", 1)[0].strip()
+    entry = _get_passwd_entry()
+    if entry is not None:
+        gecos = entry.pw_gecos.split(",", 1)[0].strip()
         if gecos:
             return gecos
-    except (ImportError, KeyError, OSError, AttributeError):
-        pass
 
-    # 2) macOS full name.
-    try:
-        result = subprocess.run(
-            ["id", "-F"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except OSError:
-        pass
+    # 2) macOS full name (Linux `id` has no -F flag).
+    if sys.platform == "darwin":
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["id", "-F"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=False,
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return result.stdout.strip()
+        except OSError:
+            pass
+
+    # 3) Last resort.
+    return _get_username()
+
+
+def _get_username() -> str:
+    """Get the current Unix username.
+
+    Reads the account database in-process, then the login environment
+    variables, and only then falls back to spawning `id -un`. Returns
+    an empty string if that fails too.
+    """
+    entry = _get_passwd_entry()
+    if entry is not None and entry.pw_name:
+        return entry.pw_name
+    for var in ("USER", "LOGNAME", "USERNAME"):
+        name = os.environ.get(var, "")
+        if name:
+            return name
+    if sys.platform == "win32":
+        return ""
+
+    import subprocess
 
-    # 3) Linux NSS database lookup as fallback.
-    user = ""
     try:
-        user = _get_username()
         result = subprocess.run(
-            ["getent", "passwd", user],
+            ["id", "-un"],
             capture_output=True,
             text=True,
             timeout=5,
-            check=False,
+            check=True,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            parts = result.stdout.strip().split(":")
-            if len(parts) >= 5:
-                full_name = parts[4].split(",", 1)[0].strip()
-                if full_name:
-                    return full_name
-    except (OSError, subprocess.CalledProcessError):
-        pass
-
-    # 4) Last resort.
-    if user:
-        return user
-    try:
-        return _get_username()
-    except (OSError, subprocess.CalledProcessError):
+    except (OSError, subprocess.SubprocessError):
         return ""
-
-
-def _get_username() -> str:
-    """Get the current Unix username."""
-    result = subprocess.run(
-        ["id", "-un"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        check=True,
-    )
     return result.stdout.strip()
 
 
@@ -93,6 +103,30 @@ def _compute_age(birthday: str) -> int:
 _CONFIG_PATH = pathlib.Path(__file__).parent.parent / "user.data.json"
 _REQUIRED_FIELDS = ["birthday", "email", "phone", "addresses", "timezone"]
 
+# Parsed config per path, keyed on (st_mtime_ns, st_size) so edits are picked up.
+_config_cache: dict[pathlib.Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _load_config() -> dict[str, Any] | None:
+    """Return the parsed user.data.json, or None if it does not exist.
+
+    The parse is reused until the file's mtime or size changes;
+    callers must not mutate the result.
+    """
+    try:
+        st = _CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(_CONFIG_PATH)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(_CONFIG_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    _config_cache[_CONFIG_PATH] = (key, data)
+    return data
+
 
 def _is_missing(field: str, value: Any) -> bool:
     """Return True if a required field value is missing/invalid."""
@@ -213,12 +247,13 @@ def personal_data() -> dict[str, Any]:
     """
     required_for_read = [f for f in _REQUIRED_FIELDS if f != "timezone"]
 
-    if not _CONFIG_PATH.exists():
+    data = _load_config()
+    if data is None:
         missing = required_for_read
-        data: dict[str, Any] = {}
+        data = {}
     else:
-        with open(_CONFIG_PATH, encoding="utf-8") as f:
-            data = json.load(f)
+        # The parse is cached; copy it so callers may mutate nested values.
+        data = copy.deepcopy(data)
         missing = [f for f in required_for_read if f not in data or _is_missing(f, data.get(f))]
 
     if missing:
@@ -1,14 +1,29 @@
 """Weather forecast utilities (US only, via weather.gov)."""
 
+import functools
 import re
-import subprocess
+import sys
+import time
 import urllib.request
+from collections import OrderedDict
 from typing import Any
 
 _NWS_URL = "https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}"
 
 _USER_AGENT = "python-mcp-tools/1.0"
 
+# Location, current conditions and forecast periods (in °F) of one page.
+_Page = tuple[str, dict[str, Any], list[dict[str, str]]]
+
+# NWS refreshes forecast pages every few minutes, so a parsed page is
+# reused per URL for this long. Pages without a forecast (often a
+# transient error or maintenance page) are not cached. Entries are
+# kept in fetch order and capped, so polling many locations cannot
+# grow the cache unbounded.
+_PAGE_TTL_SECONDS = 300.0
+_PAGE_CACHE_MAX_ENTRIES = 32
+_page_cache: OrderedDict[str, tuple[float, _Page]] = OrderedDict()
+
 # Countries that officially use Fahrenheit.
 # Keyed by alpha-2; alpha-3 mapped below.
 _FAHRENHEIT_ALPHA2 = {
@@ -33,6 +48,32 @@ _ALPHA3_TO_ALPHA2: dict[str, str] = {
 }
 
 
+# ── compiled patterns ────────────────────────────────
+
+_TEMP_F_RE = re.compile(r"(-?\d+)\s*°F")
+_INT_RE = re.compile(r"(-?\d+)")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.DOTALL)
+_HEADING_RE = re.compile(r"<h[1-6][^>]*>(.*?)</h[1-6]>", re.DOTALL)
+_BR_RE = re.compile(r"<br\s*/?>")
+_LI_RE = re.compile(r"<li[^>]*>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_PANEL_TITLE_RE = re.compile(r'<h2 class="panel-title"[^>]*>(.*?)</h2>', re.DOTALL)
+_CURRENT_LRG_RE = re.compile(r'class="myforecast-current-lrg"[^>]*>(.*?)</p>', re.DOTALL)
+_CURRENT_RE = re.compile(r'class="myforecast-current"[^>]*>(.*?)</p>', re.DOTALL)
+_DETAIL_RE = re.compile(r'id="current_conditions_detail"[^>]*>(.*?)</div>', re.DOTALL)
+_ROW_RE = re.compile(r"<tr>(.*?)</tr>", re.DOTALL)
+_CELL_RE = re.compile(r"<td[^>]*>(.*?)</td>", re.DOTALL)
+_TOMBSTONE_RE = re.compile(r'class="tombstone-container"[^>]*>(.*?)</div>', re.DOTALL)
+_PERIOD_NAME_RE = re.compile(r'class="period-name"[^>]*>(.*?)</p>', re.DOTALL)
+_SHORT_DESC_RE = re.compile(r'class="short-desc"[^>]*>(.*?)</p>', re.DOTALL)
+_PERIOD_TEMP_RE = re.compile(r'class="temp[^"]*"[^>]*>(.*?)</p>', re.DOTALL)
+_IMG_ALT_RE = re.compile(r'<img[^>]+alt="([^"]*)"')
+
+
 # ── temperature helpers ──────────────────────────────
 
 
@@ -41,6 +82,21 @@ def _f_to_c(fahrenheit: float) -> float:
     return round((fahrenheit - 32) * 5 / 9, 1)
 
 
+def _read_global_preferences() -> dict[str, Any]:
+    """Read the macOS global preferences plist, or {} if unavailable."""
+    import os
+    import plistlib
+
+    path = os.path.expanduser("~/Library/Preferences/.GlobalPreferences.plist")
+    try:
+        with open(path, "rb") as f:
+            prefs = plistlib.load(f)
+    except (OSError, ValueError, plistlib.InvalidFileException):
+        return {}
+    return prefs if isinstance(prefs, dict) else {}
+
+
+@functools.cache
 def _prefer_celsius() -> bool:
     """Check if the system prefers Celsius.
 
@@ -48,13 +104,22 @@ def _prefer_celsius() -> bool:
       1. macOS: AppleTemperatureUnit / AppleMeasurementUnits
       2. Linux: LC_MEASUREMENT or GNOME/KDE settings
       3. Fallback: locale country code
+
+    Detected once per process, since it may spawn `defaults` or
+    `gsettings`.
     """
-    import platform
+    # ── macOS ────────────────────────────────────────
+    if sys.platform == "darwin":
+        # The preferences plist answers without forking `defaults`;
+        # fall back to it when the keys have not been written to disk.
+        prefs = _read_global_preferences()
+        if "AppleTemperatureUnit" in prefs:
+            return prefs["AppleTemperatureUnit"] == "Celsius"
+        if "AppleMeasurementUnits" in prefs:
+            return prefs["AppleMeasurementUnits"] == "Centimeters"
 
-    os_name = platform.system()
+        import subprocess
 
-    # ── macOS ────────────────────────────────────────
-    if os_name == "Darwin":
         try:
             r = subprocess.run(
                 [
@@ -89,7 +154,7 @@ def _prefer_celsius() -> bool:
             pass
 
     # ── Linux ────────────────────────────────────────
-    if os_name == "Linux":
+    if sys.platform.startswith("linux"):
         import os
 
         # LC_MEASUREMENT=en_US.UTF-8 → extract country
@@ -102,6 +167,8 @@ def _prefer_celsius() -> bool:
             return country not in _FAHRENHEIT_ALPHA2
 
         # GNOME: gsettings (org.gnome.system.locale)
+        import subprocess
+
         try:
             r = subprocess.run(
                 [
@@ -135,35 +202,48 @@ def _prefer_celsius() -> bool:
 
 def _convert_temp_str(text: str, celsius: bool) -> str:
     """Replace °F values with °C in a string."""
-    if not celsius:
+    if not celsius or "°F" not in text:
         return text
 
     def _repl(m: re.Match[str]) -> str:
         return f"{_f_to_c(float(m.group(1)))}°C"
 
-    return re.sub(r"(-?\d+)\s*°F", _repl, text)
+    return _TEMP_F_RE.sub(_repl, text)
 
 
 def _extract_temp_number(text: str) -> float | None:
     """Pull the first integer from a temperature string."""
-    m = re.search(r"(-?\d+)", text)
+    m = _INT_RE.search(text)
     return float(m.group(1)) if m else None
 
 
 # ── HTML helpers ─────────────────────────────────────
 
 
+# Entities seen on NWS pages, decoded in this order.
+_ENTITIES = (
+    ("&deg;", "°"),
+    ("&#176;", "°"),
+    ("&amp;", "&"),
+    ("&nbsp;", " "),
+)
+
+
+def _decode_entities(text: str) -> str:
+    """Decode the common entities in `_ENTITIES`."""
+    # Most captured fragments contain no entity at all.
+    if "&" not in text:
+        return text
+    for entity, char in _ENTITIES:
+        text = text.replace(entity, char)
+    return text
+
+
 def _strip_tags(html: str) -> str:
     """Remove HTML tags and decode common entities."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    for entity, char in (
-        ("&deg;", "°"),
-        ("&#176;", "°"),
-        ("&amp;", "&"),
-        ("&nbsp;", " "),
-    ):
-        text = text.replace(entity, char)
-    return re.sub(r"\s+", " ", text).strip()
+    text = _TAG_RE.sub(" ", html)
+    text = _decode_entities(text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _html_to_markdown(html: str) -> str:
@@ -172,91 +252,86 @@ def _html_to_markdown(html: str) -> str:
     Strips scripts/styles, converts headings, paragraphs,
     line breaks, and table rows into readable Markdown text.
     """
-    text = re.sub(
-        r"<(script|style)[^>]*>.*?</\1>",
-        "",
-        html,
-        flags=re.DOTALL,
-    )
-    text = re.sub(
-        r"<h[1-6][^>]*>(.*?)</h[1-6]>",
-        r"\n## \1\n",
-        text,
-        flags=re.DOTALL,
-    )
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    text = re.sub(r"</p>", "\n", text)
-    text = re.sub(r"</tr>", "\n", text)
-    text = re.sub(r"</td>", " | ", text)
-    text = re.sub(r"<li[^>]*>", "- ", text)
-    text = re.sub(r"<[^>]+>", "", text)
-    for entity, char in (
-        ("&deg;", "°"),
-        ("&#176;", "°"),
-        ("&amp;", "&"),
-        ("&nbsp;", " "),
-    ):
-        text = text.replace(entity, char)
-    return re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = _SCRIPT_STYLE_RE.sub("", html)
+    text = _HEADING_RE.sub(r"\n## \1\n", text)
+    text = _BR_RE.sub("\n", text)
+    text = text.replace("</p>", "\n")
+    text = text.replace("</tr>", "\n")
+    text = text.replace("</td>", " | ")
+    text = _LI_RE.sub("- ", text)
+    text = _TAG_RE.sub("", text)
+    text = _decode_entities(text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
 
 
 # ── page extraction ──────────────────────────────────
 
 
-def _find(pattern: str, html: str) -> str:
-    """Search HTML for pattern, return group(1) stripped."""
-    m = re.search(pattern, html, re.DOTALL)
+def _find(pattern: re.Pattern[str], html: str, literal: str = "") -> str:
+    """Search HTML for pattern, return group(1) stripped.
+
+    `literal` is a fixed prefix every match starts with. When given,
+    a fast `str.find` locates its first occurrence and the regex scan
+    starts there, or is skipped entirely if it is absent.
+    """
+    start = 0
+    if literal:
+        start = html.find(literal)
+        if start < 0:
+            return ""
+    m = pattern.search(html, start)
     return _strip_tags(m.group(1)) if m else ""
 
 
+def _store_page(source_url: str, now: float, page: _Page) -> None:
+    """Cache a parsed page, dropping expired and excess older entries."""
+    _page_cache.pop(source_url, None)
+    # Oldest fetches come first, so stop at the first live entry once under the cap.
+    while _page_cache:
+        fetched_at = next(iter(_page_cache.values()))[0]
+        if now - fetched_at < _PAGE_TTL_SECONDS and len(_page_cache) < _PAGE_CACHE_MAX_ENTRIES:
+            break
+        _page_cache.popitem(last=False)
+    _page_cache[source_url] = (now, page)
+
+
 def _fetch_weather_html(source_url: str) -> str:
     """Fetch weather HTML from the configured source URL."""
     req = urllib.request.Request(
         source_url,
-        headers={"User-Agent": _USER_AGENT},
+        headers={"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"},
     )
     with urllib.request.urlopen(req, timeout=15) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+        body = resp.read()
+        # urllib does not decode Content-Encoding itself.
+        if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+            import gzip
+
+            body = gzip.decompress(body)
+    return body.decode("utf-8", errors="replace")
 
 
 def _parse_current(html: str) -> dict[str, Any]:
     """Extract current conditions from NWS page HTML."""
     current: dict[str, Any] = {}
 
-    temp = _find(
-        r'class="myforecast-current-lrg"[^>]*>(.*?)</p>',
-        html,
-    )
+    temp = _find(_CURRENT_LRG_RE, html, 'class="myforecast-current-lrg"')
     if temp:
         current["temperature"] = temp
 
     # Conditions text (e.g. "Showers", "Partly Cloudy")
     # is in "myforecast-current" (without -lrg / -sm)
-    cond = _find(
-        r'class="myforecast-current"[^>]*>(.*?)</p>',
-        html,
-    )
+    cond = _find(_CURRENT_RE, html, 'class="myforecast-current"')
     if cond and cond != "NA":
         current["conditions"] = cond
 
     # Detail table (humidity, wind, pressure, etc.)
-    detail_m = re.search(
-        r'id="current_conditions_detail"[^>]*>(.*?)</div>',
-        html,
-        re.DOTALL,
-    )
+    detail_start = html.find('id="current_conditions_detail"')
+    detail_m = _DETAIL_RE.search(html, detail_start) if detail_start >= 0 else None
     if detail_m:
-        rows = re.findall(
-            r"<tr>(.*?)</tr>",
-            detail_m.group(1),
-            re.DOTALL,
-        )
+        rows = _ROW_RE.findall(detail_m.group(1))
         for row in rows:
-            cells = re.findall(
-                r"<td[^>]*>(.*?)</td>",
-                row,
-                re.DOTALL,
-            )
+            cells = _CELL_RE.findall(row)
             if len(cells) >= 2:
                 key = _strip_tags(cells[0])
                 val = _strip_tags(cells[1])
@@ -271,29 +346,28 @@ def _parse_forecast(html: str) -> list[dict[str, str]]:
     """Extract forecast periods from NWS page HTML."""
     periods: list[dict[str, str]] = []
 
-    tombstones = re.findall(
-        r'class="tombstone-container"[^>]*>(.*?)</div>',
-        html,
-        re.DOTALL,
-    )
+    first = html.find('class="tombstone-container"')
+    if first < 0:
+        return periods
+    tombstones = _TOMBSTONE_RE.findall(html, first)
 
     for tomb in tombstones:
         period: dict[str, str] = {}
 
-        name = _find(r'class="period-name"[^>]*>(.*?)</p>', tomb)
+        name = _find(_PERIOD_NAME_RE, tomb)
         if name:
             period["name"] = name
 
-        summary = _find(r'class="short-desc"[^>]*>(.*?)</p>', tomb)
+        summary = _find(_SHORT_DESC_RE, tomb)
         if summary:
             period["summary"] = summary
 
-        temp = _find(r'class="temp[^"]*"[^>]*>(.*?)</p>', tomb)
+        temp = _find(_PERIOD_TEMP_RE, tomb)
         if temp:
             period["temperature"] = temp
 
         # img alt has the best detailed description
-        alt_m = re.search(r'<img[^>]+alt="([^"]*)"', tomb, re.DOTALL)
+        alt_m = _IMG_ALT_RE.search(tomb)
         if alt_m:
             period["detail"] = alt_m.group(1)
 
@@ -303,6 +377,32 @@ def _parse_forecast(html: str) -> list[dict[str, str]]:
     return periods
 
 
+def _parse_page(html: str) -> _Page:
+    """Parse location, current conditions and forecast (in °F) from a page."""
+    location = _find(_PANEL_TITLE_RE, html, '<h2 class="panel-title"')
+    return location, _parse_current(html), _parse_forecast(html)
+
+
+def _load_page(source_url: str) -> _Page | None:
+    """Fetch and parse a forecast page, or None if it has no forecast.
+
+    Parsed pages are cached per URL for `_PAGE_TTL_SECONDS`, so a page
+    is parsed once whatever unit is requested; callers must copy before
+    mutating the result. A page without a forecast is not cached.
+    """
+    now = time.monotonic()
+    cached = _page_cache.get(source_url)
+    if cached is not None and now - cached[0] < _PAGE_TTL_SECONDS:
+        return cached[1]
+
+    html = _fetch_weather_html(source_url)
+    if not html or "seven-day-forecast" not in html:
+        return None
+    page = _parse_page(html)
+    _store_page(source_url, now, page)
+    return page
+
+
 # ── public function ──────────────────────────────────
 
 
@@ -332,20 +432,14 @@ def current_with_forecast(
     url = source_url or _NWS_URL.format(lat=latitude, lon=longitude)
 
     try:
-        html = _fetch_weather_html(url)
+        page = _load_page(url)
     except Exception as e:
         return {"error": f"Failed to fetch weather: {e}"}
 
     # Check if the page returned usable data
-    if not html or "seven-day-forecast" not in html:
+    if page is None:
         return {"error": ("No forecast data found. Coordinates may be outside the US or invalid.")}
 
-    # Extract location
-    location = _find(r'<h2 class="panel-title"[^>]*>(.*?)</h2>', html)
-
-    # Extract location
-    location = _find(r'<h2 class="panel-title"[^>]*>(.*?)</h2>', html)
-
     # Resolve temperature unit
     norm = unit.strip().lower()
     if norm in ("c", "celsius"):
@@ -355,8 +449,10 @@ def current_with_forecast(
     else:
         celsius = _prefer_celsius()
 
-    current = _parse_current(html)
-    forecast = _parse_forecast(html)
+    location, cached_current, cached_forecast = page
+    # Copy the cached parse so unit conversion never mutates it.
+    current = dict(cached_current)
+    forecast = [dict(period) for period in cached_forecast]
 
     # Convert temperatures if needed
     if celsius: